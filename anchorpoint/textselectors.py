@@ -7,14 +7,35 @@ Model <https://www.w3.org/TR/annotation-model/>`_.
 
 from __future__ import annotations
 
+import math
 import re
+import sys
 
-from typing import List, Optional, Sequence, Tuple, TypeVar, Union
-from anchorpoint.textsequences import TextPassage, TextSequence
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar, Union
+from anchorpoint.textsequences import TextPassage, TextSequence, _join_passages
 from ranges import Range, RangeSet, Inf
 from ranges._helper import _InfiniteValue
 from pydantic import BaseModel, field_validator, model_validator
 
+# Shortest stripped prefix considered selective enough to locate
+# candidate matches with str.find before running the regex.
+_MIN_ANCHOR_LENGTH = 8
+
+# Longest selector text that is interned. Interned strings are never
+# freed, so long quotations are left as ordinary strings.
+_MAX_INTERN_LENGTH = 256
+
+# Longest combined prefix, exact and suffix whose search plan is cached.
+# Longer selectors are planned again on each search, so the plan cache
+# never keeps a long quotation alive.
+_MAX_CACHED_SELECTOR_LENGTH = 1024
+
+# Compiled patterns and literals used to search for a selector,
+# as returned by :func:`_plan_search`.
+_SearchPlan = Tuple[re.Pattern, Optional[re.Pattern], Tuple[str, ...], bool, str]
+
 
 class TextSelectionError(Exception):
     """Exception for failing to select text as described by user."""
@@ -22,6 +43,147 @@ class TextSelectionError(Exception):
     pass
 
 
+@lru_cache(maxsize=1)
+def _fold_ascii(text: str) -> Optional[str]:
+    """
+    Lowercase an ASCII text for case-insensitive substring searches.
+
+    Returns None for non-ASCII text, where :meth:`str.lower` may not agree
+    with :data:`re.IGNORECASE` or may change string length. Only the most
+    recent text is cached, so many selectors searching the same text fold it
+    once. That text and its lowercase copy stay in memory until a different
+    text is searched.
+    """
+    return text.lower() if text.isascii() else None
+
+
+@lru_cache(maxsize=32)
+def _deletion_table(characters: str) -> dict:
+    """Make a :meth:`str.translate` table that deletes the given characters."""
+    return str.maketrans("", "", characters)
+
+
+def _match_at_literal(
+    pattern: re.Pattern, text: str, literal: str, pos: int = 0
+) -> Optional[re.Match]:
+    """
+    Find the first match of a pattern that must begin with a literal string.
+
+    Candidate positions are found with :meth:`str.find`, so the regex
+    engine only runs anchored at places where the literal appears.
+    """
+    index = text.find(literal, pos)
+    while index != -1:
+        match = pattern.match(text, index)
+        if match:
+            return match
+        index = text.find(literal, index + 1)
+    return None
+
+
+def _prefix_regex(prefix: str) -> str:
+    """Get regex for a prefix followed by any whitespace."""
+    return rf"{re.escape(prefix.strip())}\s*" if prefix else ""
+
+
+def _suffix_regex(suffix: str) -> str:
+    """Get regex for any whitespace followed by a suffix."""
+    return rf"\s*{re.escape(suffix.strip())}" if suffix else ""
+
+
+def _regex_without_exact(prefix: str, suffix: str) -> str:
+    """Get regex for a passage identified only by its prefix and suffix."""
+
+    if not (prefix or suffix):
+        return r"^.*$"
+
+    if not prefix:
+        return rf"^(.*?){_suffix_regex(suffix)}"
+
+    if not suffix:
+        return rf"{_prefix_regex(prefix)}(.*)$"
+
+    return rf"{_prefix_regex(prefix)}(.*){_suffix_regex(suffix)}".strip()
+
+
+def _passage_regex(prefix: str, exact: str, suffix: str) -> str:
+    """
+    Get regex to identify the text selected by a :class:`TextQuoteSelector`.
+    """
+
+    if not exact:
+        return _regex_without_exact(prefix, suffix)
+
+    exact_regex = re.escape(exact)
+    return rf"{_prefix_regex(prefix)}({exact_regex}){_suffix_regex(suffix)}".strip()
+
+
+def _folded_passage_regex(prefix: str, exact: str, suffix: str) -> str:
+    """
+    Get a case-sensitive passage regex for text lowercased by :func:`_fold_ascii`.
+
+    Only equivalent to :func:`_passage_regex` with :data:`re.IGNORECASE`
+    when the selector's fields and the text are ASCII.
+    """
+    return _passage_regex(prefix.lower(), exact.lower(), suffix.lower())
+
+
+def _required_literals(prefix: str, exact: str, suffix: str) -> Tuple[str, ...]:
+    """Get the literal strings that must all appear in a passage matching a selector."""
+    return tuple(
+        literal for literal in (prefix.strip(), exact, suffix.strip()) if literal
+    )
+
+
+def _search_plan(prefix: str, exact: str, suffix: str) -> _SearchPlan:
+    """
+    Get the compiled patterns and literals used to search for a selector.
+
+    Plans for selectors up to :data:`_MAX_CACHED_SELECTOR_LENGTH` characters
+    long are cached, so each search only needs one lookup.
+    """
+    if len(prefix) + len(exact) + len(suffix) > _MAX_CACHED_SELECTOR_LENGTH:
+        return _plan_search(prefix, exact, suffix)
+    return _cached_search_plan(prefix, exact, suffix)
+
+
+@lru_cache(maxsize=256)
+def _cached_search_plan(prefix: str, exact: str, suffix: str) -> _SearchPlan:
+    """Get the search plan for a short selector, reusing plans already made."""
+    return _plan_search(prefix, exact, suffix)
+
+
+def _plan_search(prefix: str, exact: str, suffix: str) -> _SearchPlan:
+    """
+    Make the compiled patterns and literals used to search for a selector.
+
+    Returns a tuple of:
+
+    * the case-insensitive passage pattern
+    * a case-sensitive pattern for text lowercased by :func:`_fold_ascii`,
+      or None if the selector isn't ASCII
+    * the lowercased literals that every match must contain, in order
+    * whether every match starts with the first of those literals
+    * the lowercased literal that every match starts with, or an empty
+      string if there is none selective enough to search for
+    """
+    pattern = re.compile(_passage_regex(prefix, exact, suffix), re.IGNORECASE)
+    literals = _required_literals(prefix, exact, suffix)
+    if not all(literal.isascii() for literal in literals):
+        return pattern, None, (), False, ""
+    folded_pattern = re.compile(_folded_passage_regex(prefix, exact, suffix))
+    if prefix:
+        anchor = prefix.strip()
+        starts_with_literal = bool(anchor)
+        if len(anchor) < _MIN_ANCHOR_LENGTH:
+            anchor = ""
+    else:
+        starts_with_literal = bool(exact)
+        anchor = exact
+    folded_literals = tuple(literal.lower() for literal in literals)
+    return pattern, folded_pattern, folded_literals, starts_with_literal, anchor.lower()
+
+
 class TextQuoteSelector(BaseModel):
     """
     Describes a textual segment by quoting it, or passages before or after it.
@@ -59,10 +221,11 @@ class TextQuoteSelector(BaseModel):
         :returns: a tuple of the three values
         """
 
-        if text.count("|") == 0:
+        parts = text.split("|")
+        if len(parts) == 1:
             return ("", text, "")
-        elif text.count("|") == 2:
-            return tuple([*text.split("|")])
+        elif len(parts) == 3:
+            return tuple(parts)
         raise TextSelectionError(
             "If the 'text' field includes | pipe separators, it must contain exactly "
             "two, separating the string into 'prefix', 'exact', and 'suffix'."
@@ -76,6 +239,14 @@ class TextQuoteSelector(BaseModel):
             return ""
         return value
 
+    @field_validator("prefix", "exact", "suffix", mode="after")
+    @classmethod
+    def intern_text(cls, value: str) -> str:
+        """Intern short selector text so selectors quoting the same document share strings."""
+        if len(value) > _MAX_INTERN_LENGTH:
+            return value
+        return sys.intern(value)
+
     @classmethod
     def from_text(cls, text: str) -> TextQuoteSelector:
         """
@@ -118,8 +289,41 @@ class TextQuoteSelector(BaseModel):
         >>> selector.find_match(text)
         <re.Match object; span=(17, 36), match='method of operation'>
         """
-        pattern = self.passage_regex()
-        return re.search(pattern, text, re.IGNORECASE)
+        return self._search(text)
+
+    def _search(self, text: str, pos: int = 0) -> Optional[re.Match]:
+        """Get the first match for the selector in text, starting from index ``pos``."""
+        pattern, folded_pattern, literals, starts_with_literal, anchor = _search_plan(
+            self.prefix, self.exact, self.suffix
+        )
+        if folded_pattern is not None:
+            folded_text = _fold_ascii(text)
+            if folded_text is not None:
+                # The literals must appear in order without overlapping,
+                # and a match can't start before the first of them.
+                index = pos
+                for literal in literals:
+                    index = folded_text.find(literal, index)
+                    if index == -1:
+                        return None
+                    index += len(literal)
+                if starts_with_literal:
+                    start = folded_text.find(literals[0], pos)
+                else:
+                    start = pos
+                # Search the lowercased text without IGNORECASE, which lets
+                # the regex engine use its literal prefix scan, then rebuild
+                # the match on the original text from the same start.
+                if anchor:
+                    found = _match_at_literal(
+                        folded_pattern, folded_text, anchor, start
+                    )
+                else:
+                    found = folded_pattern.search(folded_text, start)
+                if found is None:
+                    return None
+                return pattern.match(text, found.start())
+        return pattern.search(text, pos)
 
     def select_text(self, text: str) -> Optional[str]:
         """
@@ -169,11 +373,20 @@ class TextQuoteSelector(BaseModel):
         :returns:
             the position selector for the location of the exact quotation
         """
-        match = self.find_match(text)
-        if match:
-            # Getting indices from match group 1 (in the parentheses),
-            # not match 0 which includes prefix and suffix
-            return TextPositionSelector(start=match.start(1), end=match.end(1))
+        folded = self._folded_exact(text)
+        if folded is not None:
+            folded_text, literal = folded
+            start = folded_text.find(literal)
+            if start != -1:
+                return TextPositionSelector._unchecked(
+                    start=start, end=start + len(literal)
+                )
+        else:
+            match = self.find_match(text)
+            if match:
+                # Getting indices from match group 1 (in the parentheses),
+                # not match 0 which includes prefix and suffix
+                return TextPositionSelector(start=match.start(1), end=match.end(1))
         text_sample = text[:100] + "..." if len(text) > 100 else text
         raise TextSelectionError(
             f'Unable to find pattern "{self.passage_regex()}" in text: "{text_sample}"'
@@ -208,47 +421,51 @@ class TextQuoteSelector(BaseModel):
         :returns:
             whether the passage appears exactly once
         """
+        folded = self._folded_exact(text)
+        if folded is not None:
+            folded_text, literal = folded
+            first = folded_text.find(literal)
+            if first == -1:
+                return False
+            return folded_text.find(literal, first + len(literal)) == -1
         match = self.find_match(text)
         if match:
-            second_match = self.find_match(text[match.end(1) :])
-            return not bool(second_match)
+            if not (self.prefix or self.exact):
+                # Without a literal start the pattern is anchored with "^",
+                # which can't match at a search position after the start.
+                return not self.find_match(text[match.end(1) :])
+            return not self._search(text, match.end(1))
         return False
 
-    def _passage_regex_without_exact(self) -> str:
-        """Get regex for the passage given the "exact" parameter is missing."""
-
-        if not (self.prefix or self.suffix):
-            return r"^.*$"
-
-        if not self.prefix:
-            return r"^(.*?)" + self.suffix_regex()
+    def _folded_exact(self, text: str) -> Optional[Tuple[str, str]]:
+        """
+        Get lowercased text and quotation to find the selector with :meth:`str.find`.
 
-        if not self.suffix:
-            return self.prefix_regex() + r"(.*)$"
+        An exact-only selector matches wherever its literal text appears.
+        Returns None if the selector has a prefix or suffix, or if the
+        quotation or text isn't ASCII.
+        """
+        if self.exact and not (self.prefix or self.suffix) and self.exact.isascii():
+            folded_text = _fold_ascii(text)
+            if folded_text is not None:
+                return folded_text, self.exact.lower()
+        return None
 
-        return (self.prefix_regex() + r"(.*)" + self.suffix_regex()).strip()
+    def _passage_regex_without_exact(self) -> str:
+        """Get regex for the passage given the "exact" parameter is missing."""
+        return _regex_without_exact(self.prefix, self.suffix)
 
     def passage_regex(self):
         """Get regex to identify the selected text."""
-
-        if not self.exact:
-            return self._passage_regex_without_exact()
-
-        return (
-            self.prefix_regex()
-            + r"("
-            + re.escape(self.exact)
-            + r")"
-            + self.suffix_regex()
-        ).strip()
+        return _passage_regex(self.prefix, self.exact, self.suffix)
 
     def prefix_regex(self):
         """Get regex for the text before any whitespace and the selection."""
-        return (re.escape(self.prefix.strip()) + r"\s*") if self.prefix else ""
+        return _prefix_regex(self.prefix)
 
     def suffix_regex(self):
         """Get regex for the text following the selection and any whitespace."""
-        return (r"\s*" + re.escape(self.suffix.strip())) if self.suffix else ""
+        return _suffix_regex(self.suffix)
 
 
 ST = TypeVar("ST")
@@ -285,28 +502,30 @@ class TextPositionSelector(BaseModel):
             end = range.end
         return TextPositionSelector(start=range.start, end=end)
 
-    @field_validator("start", mode="after")
     @classmethod
-    def start_not_negative(cls, v: int) -> int:
+    def _unchecked(cls, start: int, end: Optional[int]) -> TextPositionSelector:
         """
-        Verify start position is not negative.
+        Make TextPositionSelector without running validators.
 
-        :returns:
-            the start position, which is not negative
+        Callers must guarantee that ``start`` is not negative and that ``end``
+        is None or greater than ``start``.
         """
-        if v < 0:
-            raise IndexError("Start position for text range cannot be negative.")
-        return v
+        return cls.model_construct(start=start, end=end)
 
     @model_validator(mode="after")
-    def start_less_than_end(self) -> "TextPositionSelector":
+    def valid_positions(self) -> "TextPositionSelector":
         """
-        Verify start position is before the end position.
+        Verify start position is not negative and is before the end position.
+
+        Both checks run in one validator, since selectors are created often.
 
         :returns:
-            the end position, which after the start position
+            the selector, if its positions are valid
         """
-        if self.end is not None and self.end <= self.start:
+        start, end = self.start, self.end
+        if start < 0:
+            raise IndexError("Start position for text range cannot be negative.")
+        if end is not None and end <= start:
             raise IndexError("End position must be greater than start position.")
         return self
 
@@ -347,7 +566,7 @@ class TextPositionSelector(BaseModel):
         else:
             new_end = self.end + value
 
-        return TextPositionSelector(start=self.start + value, end=new_end)
+        return TextPositionSelector._unchecked(start=self.start + value, end=new_end)
 
     def __gt__(self, other: Union[TextPositionSelector, TextPositionSet]) -> bool:
         """
@@ -443,10 +662,9 @@ class TextPositionSelector(BaseModel):
                     f"Subtracting {value} from ({self.start}, {self.end}) "
                     "would result in a negative end position."
                 )
-        return TextPositionSelector(
-            start=new_start,
-            end=new_end,
-        )
+            if new_end <= new_start:
+                raise IndexError("End position must be greater than start position.")
+        return TextPositionSelector._unchecked(start=new_start, end=new_end)
 
     def __sub__(
         self, value: Union[int, TextPositionSelector, TextPositionSet]
@@ -516,12 +734,37 @@ class TextPositionSelector(BaseModel):
             the passage where an exact quotation needs to be located
         """
         exact = text[self.start : self.end]
-        for margins in range(0, len(text) - len(exact), 5):
+        margins = range(0, len(text) - len(exact), 5)
+
+        def quote_with_margin(index: int) -> Optional[TextQuoteSelector]:
             new_selector = self.as_quote(
-                text=text, left_margin=margins, right_margin=margins
+                text=text, left_margin=margins[index], right_margin=margins[index]
             )
-            if new_selector.is_unique_in(text):
-                return new_selector
+            return new_selector if new_selector.is_unique_in(text) else None
+
+        # Grow the margin exponentially until the quote is unique, then
+        # binary search for the smallest unique margin below that point.
+        too_small = -1
+        index = 0
+        unique = None
+        while index < len(margins):
+            unique = quote_with_margin(index)
+            if unique:
+                break
+            too_small = index
+            index = index * 2 or 1
+        if not unique and too_small < len(margins) - 1:
+            index = len(margins) - 1
+            unique = quote_with_margin(index)
+        if unique:
+            while index - too_small > 1:
+                middle = (too_small + index) // 2
+                candidate = quote_with_margin(middle)
+                if candidate:
+                    index, unique = middle, candidate
+                else:
+                    too_small = middle
+            return unique
         return TextQuoteSelector(
             exact=exact, prefix=text[: self.start], suffix=text[self.end :]
         )
@@ -547,12 +790,114 @@ class TextPositionSelector(BaseModel):
         return None
 
 
+# A (start, end) pair of text positions, with ``math.inf`` for no end.
+Span = Tuple[int, float]
+
+
+def _merge_spans(spans: Iterable[Span]) -> List[Span]:
+    """
+    Merge (start, end) spans into sorted, disjoint spans.
+
+    Spans that overlap or touch are combined, as in a python-ranges RangeSet.
+    An end of ``math.inf`` means the span has no upper bound.
+    """
+    merged: List[Span] = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _intersect_spans(spans: List[Span], other: List[Span]) -> List[Span]:
+    """
+    Intersect two lists of sorted, disjoint spans in one merge-style pass.
+
+    Both lists must be in the form returned by :func:`_merge_spans`.
+    """
+    result: List[Span] = []
+    i = j = 0
+    while i < len(spans) and j < len(other):
+        start = max(spans[i][0], other[j][0])
+        end = min(spans[i][1], other[j][1])
+        if start < end:
+            result.append((start, end))
+        # Whichever span ends first can't overlap anything later in the other list.
+        if spans[i][1] < other[j][1]:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+def _subtract_spans(spans: List[Span], other: List[Span]) -> List[Span]:
+    """
+    Remove the parts of sorted, disjoint spans that overlap another such list.
+
+    Both lists must be in the form returned by :func:`_merge_spans`. Only
+    spans of ``other`` that overlap each span are visited.
+    """
+    result: List[Span] = []
+    j = 0
+    for start, end in spans:
+        # Spans of ``other`` ending before this span can't reach later ones.
+        while j < len(other) and other[j][1] <= start:
+            j += 1
+        k = j
+        while k < len(other) and other[k][0] < end:
+            if other[k][0] > start:
+                result.append((start, other[k][0]))
+            if other[k][1] >= end:
+                break
+            start = max(start, int(other[k][1]))
+            k += 1
+        else:
+            result.append((start, end))
+    return result
+
+
 class TextPositionSet(BaseModel):
     r"""A set of TextPositionSelectors."""
 
     positions: List[TextPositionSelector] = []
     quotes: List[TextQuoteSelector] = []
 
+    def __contains__(self, position: int) -> bool:
+        """
+        Test if a text position is inside any of the selected ranges.
+
+        >>> position_set = TextPositionSet(
+        ...     positions=[
+        ...         TextPositionSelector(start=0, end=5),
+        ...         TextPositionSelector(start=10, end=15),
+        ...     ]
+        ... )
+        >>> 12 in position_set
+        True
+        >>> 5 in position_set
+        False
+        """
+        return any(
+            selector.start <= position
+            and (selector.end is None or position < selector.end)
+            for selector in self.positions
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return (
+            type(other) is type(self)
+            and self._position_pairs() == other._position_pairs()
+            and self.quotes == other.quotes
+        )
+
+    def _position_pairs(self) -> List[Tuple[int, Optional[int]]]:
+        """Get the (start, end) of each position selector, in order."""
+        return [(selector.start, selector.end) for selector in self.positions]
+
     @classmethod
     def from_quotes(
         cls,
@@ -583,6 +928,78 @@ class TextPositionSet(BaseModel):
         selectors = [TextPositionSelector.from_range(item) for item in ranges]
         return cls(positions=selectors)
 
+    @classmethod
+    def from_selectors(
+        cls, selectors: Iterable[TextPositionSelector]
+    ) -> TextPositionSet:
+        """
+        Make new class instance covering the union of many position selectors.
+
+        Sorts the selectors once and merges overlapping or touching ranges in
+        a single pass, which is faster than adding the selectors together one
+        at a time.
+
+        >>> position_set = TextPositionSet.from_selectors(
+        ...     [
+        ...         TextPositionSelector(start=10, end=15),
+        ...         TextPositionSelector(start=0, end=5),
+        ...         TextPositionSelector(start=3, end=8),
+        ...     ]
+        ... )
+        >>> [(selector.start, selector.end) for selector in position_set.positions]
+        [(0, 8), (10, 15)]
+        """
+        return cls._from_spans(
+            _merge_spans(
+                (selector.start, math.inf if selector.end is None else selector.end)
+                for selector in selectors
+            )
+        )
+
+    @classmethod
+    def _from_spans(cls, spans: List[Span]) -> TextPositionSet:
+        """
+        Make new class instance from (start, end) spans without running validators.
+
+        The spans must be sorted and disjoint, as returned by :func:`_merge_spans`.
+        """
+        unchecked = TextPositionSelector._unchecked
+        return cls.model_construct(
+            positions=[
+                unchecked(start=start, end=None if end == math.inf else int(end))
+                for start, end in spans
+            ]
+        )
+
+    def _spans(self) -> List[Span]:
+        """Get (start, end) pairs for positions, with ``math.inf`` for no end."""
+        return [
+            (selector.start, math.inf if selector.end is None else selector.end)
+            for selector in self.positions
+        ]
+
+    def _merged_spans(self) -> List[Span]:
+        """Get the sorted, disjoint spans covered by positions."""
+        return _merge_spans(self._spans())
+
+    def _covers(self, spans: Iterable[Span]) -> bool:
+        """
+        Test if every one of the given (start, end) spans is inside self's ranges.
+
+        The spans must be sorted by start, so the check is one forward walk
+        over self's merged spans, like the merge step of a merge sort.
+        """
+        merged = self._merged_spans()
+        index = 0
+        for start, end in spans:
+            # Merged spans don't touch, so a covered span fits inside just one:
+            # the first of self's spans that doesn't end before it does.
+            while index < len(merged) and merged[index][1] < end:
+                index += 1
+            if index == len(merged) or merged[index][0] > start:
+                return False
+        return True
+
     def __str__(self):
         return repr(self)
 
@@ -601,8 +1018,23 @@ class TextPositionSet(BaseModel):
         """
         if not isinstance(value, int):
             return self | value
-        return TextPositionSet(
-            positions=[text_range + value for text_range in self.positions],
+        # Positions may have been reassigned out of order since validation.
+        positions = sorted(self.positions, key=attrgetter("start"))
+        if positions and positions[0].start + value < 0:
+            raise IndexError(
+                f"Adding {value} to ({positions[0].start}, {positions[0].end}) "
+                "would result in a negative start position."
+            )
+        unchecked = TextPositionSelector._unchecked
+        # Shifting every selector by the same amount keeps them in order.
+        return TextPositionSet.model_construct(
+            positions=[
+                unchecked(
+                    start=selector.start + value,
+                    end=None if selector.end is None else selector.end + value,
+                )
+                for selector in positions
+            ],
             quotes=self.quotes,
         )
 
@@ -626,12 +1058,12 @@ class TextPositionSet(BaseModel):
     ) -> bool:
         """Test if self's rangeset includes all of other's rangeset, but is not identical."""
         if isinstance(other, TextPositionSet):
-            to_compare: Union[Range, RangeSet] = other.rangeset()
-        elif isinstance(other, TextPositionSelector):
-            to_compare = other.range()
-        else:
-            to_compare = other
-        return not bool(to_compare.difference(self.rangeset()))
+            return self._covers(other._merged_spans())
+        if isinstance(other, TextPositionSelector):
+            return self._covers(
+                [(other.start, math.inf if other.end is None else other.end)]
+            )
+        return not bool(other.difference(self.rangeset()))
 
     def __ge__(
         self, other: Union[TextPositionSelector, TextPositionSet, Range, RangeSet]
@@ -644,30 +1076,43 @@ class TextPositionSet(BaseModel):
     def __or__(
         self, other: Union[TextPositionSet, TextPositionSelector]
     ) -> TextPositionSet:
+        spans = self._spans()
         if isinstance(other, TextPositionSelector):
-            other = TextPositionSet(positions=[other])
-        return self.merge_rangeset(other.rangeset())
+            spans.append((other.start, math.inf if other.end is None else other.end))
+        else:
+            spans.extend(other._spans())
+        result = TextPositionSet._from_spans(_merge_spans(spans))
+        result.quotes = self.quotes
+        return result
 
     def __and__(
         self, other: Union[TextPositionSet, TextPositionSelector]
     ) -> TextPositionSet:
         if isinstance(other, TextPositionSelector):
             other = TextPositionSet(positions=[other])
-        new_rangeset: RangeSet = self.rangeset() & other.rangeset()
-        return TextPositionSet.from_ranges(new_rangeset)
+        return TextPositionSet._from_spans(
+            _intersect_spans(self._merged_spans(), other._merged_spans())
+        )
 
     def __sub__(
         self, value: Union[int, TextPositionSelector, TextPositionSet]
     ) -> TextPositionSet:
         """Decrease all startpoints and endpoints by the given amount."""
         if not isinstance(value, int):
-            new_rangeset = self.rangeset() - value.rangeset()
-            new = TextPositionSet.from_ranges(new_rangeset)
+            if isinstance(value, TextPositionSelector):
+                value = TextPositionSet(positions=[value])
+            new = TextPositionSet._from_spans(
+                _subtract_spans(self._merged_spans(), value._merged_spans())
+            )
         else:
-            new_selectors = [
-                selector.subtract_integer(value) for selector in self.positions
-            ]
-            new = TextPositionSet.from_ranges(new_selectors)
+            # Positions may have been reassigned out of order since validation.
+            # Shifting and clipping to 0 can't reorder selectors sorted by start.
+            new = TextPositionSet.model_construct(
+                positions=[
+                    selector.subtract_integer(value)
+                    for selector in sorted(self.positions, key=attrgetter("start"))
+                ]
+            )
         new.quotes = self.quotes
         return new
 
@@ -692,6 +1137,8 @@ class TextPositionSet(BaseModel):
     @classmethod
     def is_sequence(cls, v: ST | Sequence[ST]) -> Sequence[ST]:
         """Ensure that selectors are in a sequence."""
+        if type(v) is list:
+            return v
         if not isinstance(v, Sequence):
             v = [v]
         return v
@@ -700,7 +1147,7 @@ class TextPositionSet(BaseModel):
     @classmethod
     def order_of_selectors(cls, v: list[TextPositionSelector]):
         """Ensure that selectors are in order."""
-        return sorted(v, key=lambda x: x.start)
+        return sorted(v, key=attrgetter("start"))
 
     def positions_as_quotes(self, text: str) -> List[TextQuoteSelector]:
         """Copy self's position selectors, converted to quote selectors."""
@@ -712,7 +1159,9 @@ class TextPositionSet(BaseModel):
 
     def convert_quotes_to_positions(self, text: str) -> "TextPositionSet":
         """Return new TextPositionSet with all quotes replaced by their positions in the given text."""
-        return self.merge_rangeset(self.quotes_rangeset(text))
+        result = TextPositionSet._from_spans(self._selection_spans(text))
+        result.quotes = self.quotes
+        return result
 
     def as_text_sequence(self, text: str, include_nones: bool = True) -> TextSequence:
         """
@@ -733,34 +1182,47 @@ class TextPositionSet(BaseModel):
         >>> selector_set.as_text_sequence("Some text.")
         TextSequence([None, TextPassage("text.")])
         """
-        selected: List[Union[None, TextPassage]] = []
+        return TextSequence(
+            [
+                None if phrase is None else TextPassage(phrase)
+                for phrase in self._selected_phrases(text, include_nones)
+            ]
+        )
 
-        position_ranges = self.rangeset()
-        quote_ranges = self.quotes_rangeset(text=text)
+    def _selected_phrases(
+        self, text: str, include_nones: bool = True
+    ) -> List[Optional[str]]:
+        """
+        List the strings in ``text`` selected by this TextPositionSet.
 
-        selection_rangeset = position_ranges | quote_ranges
-        selection_ranges = selection_rangeset.ranges()
+        If ``include_nones`` is True, ``None`` marks each block of unselected text.
+        """
+        selected: List[Optional[str]] = []
+        selection_spans = self._selection_spans(text)
 
-        if selection_ranges:
-            if include_nones and 0 < selection_ranges[0].start < len(text):
+        text_length = len(text)
+        if selection_spans:
+            if include_nones and 0 < selection_spans[0][0] < text_length:
                 selected.append(None)
-            for passage in selection_ranges:
-                if (
-                    passage.start is not None
-                    and passage.start < passage.end
-                    and passage.start < len(text)
-                ):
-                    string_end = (
-                        passage.end
-                        if not isinstance(passage.end, _InfiniteValue)
-                        else None
-                    )
-                    selected.append(TextPassage(text[passage.start : string_end]))
-                if include_nones and passage.end and (passage.end < len(text)):
+            for start, end in selection_spans:
+                if start < text_length:
+                    string_end = None if end == math.inf else int(end)
+                    selected.append(text[start:string_end])
+                if include_nones and end < text_length:
                     selected.append(None)
-        elif text and include_nones and (not selected or selected[-1] is not None):
+        elif text and include_nones:
             selected.append(None)
-        return TextSequence(selected)
+        return selected
+
+    def _selection_spans(self, text: str) -> List[Span]:
+        """Get merged spans of self's positions and of its quotes found in text."""
+        quote_spans = [
+            (selector.start, math.inf if selector.end is None else selector.end)
+            for selector in self.positions_of_quote_selectors(text)
+        ]
+        if not quote_spans:
+            return self._merged_spans()
+        return _merge_spans(self._spans() + quote_spans)
 
     def rangeset(self) -> RangeSet:
         """Convert positions into python-ranges Rangeset."""
@@ -769,7 +1231,22 @@ class TextPositionSet(BaseModel):
 
     def positions_of_quote_selectors(self, text: str) -> List[TextPositionSelector]:
         """Convert self's quote selectors to position selectors for a given text."""
-        return [selector.as_position(text) for selector in self.quotes]
+        # Selectors quoting the same passage are only searched for once,
+        # but each gets its own position selector.
+        found: Dict[Tuple[str, str, str], Tuple[int, Optional[int]]] = {}
+        positions = []
+        for selector in self.quotes:
+            key = (selector.prefix, selector.exact, selector.suffix)
+            span = found.get(key)
+            if span is None:
+                position = selector.as_position(text)
+                found[key] = (position.start, position.end)
+                positions.append(position)
+            else:
+                positions.append(
+                    TextPositionSelector._unchecked(start=span[0], end=span[1])
+                )
+        return positions
 
     def quotes_rangeset(self, text: str) -> RangeSet:
         """Get ranges where these quotes appear in the provided text."""
@@ -779,7 +1256,10 @@ class TextPositionSet(BaseModel):
 
     def ranges(self) -> List[Range]:
         """Get positions as Range objects from python-ranges library."""
-        return self.rangeset().ranges()
+        return [
+            Range(start=start, end=Inf if end == math.inf else end)
+            for start, end in self._merged_spans()
+        ]
 
     def as_string(self, text: str) -> str:
         """
@@ -791,8 +1271,7 @@ class TextPositionSet(BaseModel):
         >>> selector_set.as_string("Some text.")
         '…text.'
         """
-        text_sequence = self.as_text_sequence(text)
-        return str(text_sequence)
+        return _join_passages(self._selected_phrases(text))
 
     def add_margin(
         self,
@@ -838,23 +1317,19 @@ class TextPositionSet(BaseModel):
         if margin_width < 1:
             raise ValueError("margin_width must be a positive integer")
 
-        new_rangeset = self.rangeset() | self.quotes_rangeset(text)
-        margin_selectors = TextPositionSet()
-        for left in new_rangeset.ranges():
-            for right in new_rangeset.ranges():
-                if (
-                    left.end is not None
-                    and left.end < right.start <= left.end + margin_width
-                ):
-                    if all(
-                        letter in margin_characters
-                        for letter in text[left.end : right.start]
-                    ):
-                        margin_selectors += TextPositionSelector(
-                            start=left.end, end=right.start
-                        )
-        with_margin = new_rangeset + margin_selectors.rangeset()
-        return TextPositionSet.from_ranges(with_margin)
+        # A gap is all margin characters if deleting them leaves nothing.
+        margin_table = _deletion_table(margin_characters)
+        # The spans are sorted and disjoint, so a margin can only join neighbors.
+        spans: List[Span] = []
+        for start, end in self._selection_spans(text):
+            # Only the last merged span can be unbounded, so earlier ends are ints.
+            if spans and start <= spans[-1][1] + margin_width:
+                gap = text[int(spans[-1][1]) : start]
+                if not gap.translate(margin_table):
+                    spans[-1] = (spans[-1][0], end)
+                    continue
+            spans.append((start, end))
+        return TextPositionSet._from_spans(spans)
 
     def select_text(
         self,
@@ -888,8 +1363,7 @@ class TextPositionSet(BaseModel):
         with_margin = self.add_margin(
             text=text, margin_width=margin_width, margin_characters=margin_characters
         )
-        text_sequence = with_margin.as_text_sequence(text)
-        return str(text_sequence)
+        return with_margin.as_string(text)
 
 
 class TextPositionSetFactory:
@@ -899,6 +1373,32 @@ class TextPositionSetFactory:
         """Store text passage that will be used to generate text selections."""
         self.text = text
 
+    @property
+    def text(self) -> str:
+        """The text passage that selections are made from."""
+        return self._text
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self._text = value
+        # Where each quotation was found in the text, by (prefix, exact, suffix).
+        self._quote_positions: Dict[Tuple[str, str, str], Tuple[int, Optional[int]]]
+        self._quote_positions = {}
+
+    def _position_of_quote(self, quote: TextQuoteSelector) -> TextPositionSelector:
+        """
+        Locate a quote selector in the text, only searching once for each quotation.
+
+        Each call returns a new selector, so callers can't change each other's.
+        """
+        key = (quote.prefix, quote.exact, quote.suffix)
+        span = self._quote_positions.get(key)
+        if span is None:
+            position = quote.as_position(self.text)
+            self._quote_positions[key] = (position.start, position.end)
+            return position
+        return TextPositionSelector._unchecked(start=span[0], end=span[1])
+
     def from_bool(self, selection: bool) -> TextPositionSet:
         """Select either the whole passage or none of it."""
         if selection is True:
@@ -943,7 +1443,7 @@ class TextPositionSetFactory:
             if isinstance(selection, str):
                 selection = TextQuoteSelector(exact=selection)
             if isinstance(selection, TextQuoteSelector):
-                selection = selection.as_position(self.text)
+                selection = self._position_of_quote(selection)
             elif not isinstance(selection, TextPositionSelector):
                 selection = TextPositionSelector(start=selection[0], end=selection[1])
             positions.append(selection)
@@ -962,5 +1462,5 @@ class TextPositionSetFactory:
         self, quotes: Sequence[TextQuoteSelector]
     ) -> TextPositionSet:
         """Construct TextPositionSet from a sequence of TextQuoteSelectors."""
-        position_selectors = [quote.as_position(self.text) for quote in quotes]
+        position_selectors = [self._position_of_quote(quote) for quote in quotes]
         return TextPositionSet(positions=position_selectors)
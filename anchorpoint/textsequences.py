@@ -2,7 +2,41 @@
 
 from __future__ import annotations
 
-from typing import List, Optional, Sequence, Union
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+# Punctuation at the ends of a passage that doesn't affect its meaning.
+_STRIP_CHARS = ",:;. "
+
+# Joins passage texts into one string to search. Any needle that doesn't
+# contain it can only be found inside a single passage.
+_PASSAGE_SEPARATOR = "\x00"
+
+
+def _join_passages(phrases: Iterable[Optional[str]]) -> str:
+    """
+    Join the text of consecutive passages into one string.
+
+    A ``None`` phrase stands for omitted text and becomes an ellipsis.
+    Other phrases are separated by a space unless one is already there.
+    """
+    parts: List[str] = []
+    last_char = ""
+    for phrase in phrases:
+        if phrase is None:
+            if last_char != "…":
+                parts.append("…")
+                last_char = "…"
+        else:
+            if last_char and last_char not in "… ":
+                parts.append(" ")
+                last_char = " "
+            if phrase:
+                parts.append(phrase)
+                last_char = phrase[-1]
+    if parts == ["…"]:
+        return ""
+    return "".join(parts)
 
 
 class TextPassage:
@@ -12,6 +46,8 @@ class TextPassage:
     Can be used to compare passages while disregarding end punctuation.
     """
 
+    __slots__ = ("_text", "_stripped")
+
     def __repr__(self):
         return f'TextPassage("{self.text}")'
 
@@ -24,6 +60,17 @@ class TextPassage:
         """
         self.text = text
 
+    @property
+    def text(self) -> str:
+        """The text content of the passage."""
+        return self._text
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self._text = value
+        # End punctuation is ignored in comparisons, so strip it once here.
+        self._stripped = value.strip(_STRIP_CHARS)
+
     def means(self, other: Optional[TextPassage]) -> bool:
         """
         Test if passages have the same text, disregarding end puncutation.
@@ -46,7 +93,15 @@ class TextPassage:
                 f"Cannot compare {self.__class__.__name__} and {other.__class__.__name__} for same meaning."
             )
 
-        return self.text.strip(",:;. ") == other.text.strip(",:;. ")
+        return self._means(other)
+
+    def _means(self, other: TextPassage) -> bool:
+        """Test if passages have the same text, given that other is a TextPassage."""
+        return self._stripped == other._stripped
+
+    def _ge(self, other: TextPassage) -> bool:
+        """Test if self's text includes other's, given that other is a TextPassage."""
+        return other._stripped in self.text
 
     def __ge__(self, other: Optional[TextPassage]) -> bool:
         if not other:
@@ -55,11 +110,12 @@ class TextPassage:
             raise TypeError(
                 f"Cannot compare {self.__class__.__name__} and {other.__class__.__name__} for implication."
             )
-        other_text = other.text.strip(",:;. ")
-        return other_text in self.text
+        return self._ge(other)
 
     def __gt__(self, other: Optional[TextPassage]) -> bool:
-        return self >= other and not self.means(other)
+        if other is None or not isinstance(other, self.__class__):
+            return self >= other and not self.means(other)
+        return self._ge(other) and not self._means(other)
 
 
 class TextSequence(Sequence[Union[None, TextPassage]]):
@@ -92,36 +148,82 @@ class TextSequence(Sequence[Union[None, TextPassage]]):
     def __getitem__(self, key):
         return self.passages[key]
 
+    def __iter__(self) -> Iterator[Optional[TextPassage]]:
+        return iter(self.passages)
+
+    def __reversed__(self) -> Iterator[Optional[TextPassage]]:
+        return reversed(self.passages)
+
+    def __contains__(self, value) -> bool:
+        return value in self.passages
+
     def __str__(self):
-        result = ""
-        for phrase in self.passages:
-            if phrase is None:
-                if not result.endswith("…"):
-                    result += "…"
-            else:
-                if result and not result.endswith(("…", " ")):
-                    result += " "
-                result += phrase.text
-        if result == "…":
-            return ""
-        return result
+        return _join_passages(
+            None if phrase is None else phrase.text for phrase in self.passages
+        )
 
     def __ge__(self, other: TextSequence):
         if not isinstance(other, self.__class__):
             raise TypeError(
                 f"Cannot compare {self.__class__.__name__} and {other.__class__.__name__} for implication."
             )
-        for other_passage in other.passages:
-            if not any(
-                (
-                    (other_passage is None)
-                    or (self_passage and self_passage >= other_passage)
-                )
-                for self_passage in self.passages
-            ):
+        if not self.passages:
+            return not other.passages
+        other_passages = [passage for passage in other.passages if passage is not None]
+        if not other_passages:
+            return True
+        self_passages = [passage for passage in self.passages if passage]
+        if not self_passages:
+            return False
+        self_texts = [
+            passage.text
+            for passage in self_passages
+            if isinstance(passage, TextPassage)
+        ]
+        # Text known to be contained in self: each passage's stripped text,
+        # plus every needle already found, so repeated needles are only
+        # searched for once.
+        found = {
+            passage._stripped
+            for passage in self_passages
+            if isinstance(passage, TextPassage)
+        }
+        haystack = _PASSAGE_SEPARATOR.join(self_texts)
+        for other_passage in other_passages:
+            if not isinstance(other_passage, TextPassage):
+                if not self._any_passage_implies(self_passages, other_passage):
+                    return False
+                continue
+            needle = other_passage._stripped
+            if needle in found:
+                continue
+            if not self._any_text_contains(self_texts, haystack, needle):
                 return False
+            found.add(needle)
         return True
 
+    @staticmethod
+    def _any_passage_implies(
+        passages: List[TextPassage], other: Optional[TextPassage]
+    ) -> bool:
+        """Compare passages with an object that isn't a TextPassage."""
+        # Let TextPassage.__ge__ raise the TypeError.
+        return any(passage >= other for passage in passages)
+
+    @staticmethod
+    def _any_text_contains(texts: List[str], haystack: str, needle: str) -> bool:
+        """
+        Test if needle is found within any one of texts.
+
+        :param haystack:
+            the texts joined by the separator character, which lets one
+            search take the place of a search of each text, unless the needle
+            itself contains the separator.
+        """
+        if texts and _PASSAGE_SEPARATOR not in needle:
+            return needle in haystack
+        return any(needle in text for text in texts)
+
     def __gt__(self, other: TextSequence):
         if self.means(other):
             return False
@@ -138,17 +240,24 @@ class TextSequence(Sequence[Union[None, TextPassage]]):
         if not self.passages:
             return other
         if other.passages[0] is self.passages[-1] is None:
-            return TextSequence(self.passages[:-1] + other.passages)
+            # Only one None is needed where omitted text on both sides meets.
+            passages = self.passages[:-1]
+            passages.extend(other.passages)
+            return TextSequence(passages)
         return TextSequence(self.passages + other.passages)
 
     def strip(self) -> TextSequence:
         """Remove symbols representing missing text from the beginning and end."""
-        result = self.passages.copy()
-        if result and result[0] is None:
-            result = result[1:]
-        if result and result[-1] is None:
-            result = result[:-1]
-        return TextSequence(result)
+        start, end = self._strip_bounds()
+        return TextSequence(self.passages[start:end])
+
+    def _strip_bounds(self) -> Tuple[int, int]:
+        """Get the slice of :attr:`passages` that :meth:`strip` keeps."""
+        passages = self.passages
+        length = len(passages)
+        start = 1 if length and passages[0] is None else 0
+        end = length - 1 if length > start and passages[-1] is None else length
+        return start, end
 
     def means(self, other: TextSequence) -> bool:
         """Test if all the passages in self and other correspond with each other."""
@@ -156,13 +265,23 @@ class TextSequence(Sequence[Union[None, TextPassage]]):
             raise TypeError(
                 f"Cannot compare {self.__class__.__name__} and {other.__class__.__name__} for same meaning."
             )
-        self_passages = self.strip().passages
-        other_passages = other.strip().passages
-        if len(self_passages) != len(other_passages):
-            return False
+        return self._strip_key() == other._strip_key()
 
-        zipped = zip(self_passages, other_passages)
-        return all(
-            pair[0].means(pair[1]) if pair[0] is not None else pair[1] is None
-            for pair in zipped
-        )
+    def _strip_key(self) -> Tuple[Optional[str], ...]:
+        """
+        Get the stripped text of each passage, after stripping the sequence.
+
+        Two sequences have the same meaning if their keys are equal.
+        """
+        start, end = self._strip_bounds()
+        key: List[Optional[str]] = []
+        for passage in islice(self.passages, start, end):
+            if passage is None:
+                key.append(None)
+            elif isinstance(passage, TextPassage):
+                key.append(passage._stripped)
+            else:
+                raise TypeError(
+                    f"Cannot compare {passage.__class__.__name__} and {TextPassage.__name__} for same meaning."
+                )
+        return tuple(key)
@@ -1,15 +1,21 @@
-from typing import Dict
+from types import MappingProxyType
+from typing import Mapping
 
 import pytest
 
+from anchorpoint.textselectors import TextPositionSetFactory, TextQuoteSelector
+from anchorpoint.textsequences import TextSequence
 
-@pytest.fixture(scope="module")
-def make_text() -> Dict[str, str]:
+
+@pytest.fixture(scope="session")
+def make_text() -> Mapping[str, str]:
     """
     Text passages to practice quoting from.
+
+    Shared by every test in the session, so the mapping is read-only.
     """
 
-    return {
+    passages = {
         "s102b": (
             "In no case does copyright protection for an original "
             + "work of authorship extend to any idea, procedure, process, system, "
@@ -28,3 +34,22 @@ def make_text() -> Dict[str, str]:
             "within its jurisdiction the equal protection of the laws."
         ),
     }
+    return MappingProxyType(passages)
+
+
+@pytest.fixture(scope="module")
+def s102b_passages_as_sequence(make_text) -> TextSequence:
+    """
+    Two quotations from s102b, with the omitted text between them as None.
+
+    Shared by the tests in a module, so the sequence shouldn't be changed in place.
+    """
+    passage = make_text["s102b"]
+    factory = TextPositionSetFactory(text=passage)
+    selector_set = factory.from_quote_selectors(
+        [
+            TextQuoteSelector(exact="In no case does copyright protection"),
+            TextQuoteSelector(exact="extend to any idea"),
+        ]
+    )
+    return selector_set.as_text_sequence(passage)
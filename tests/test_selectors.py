@@ -8,9 +8,16 @@ from anchorpoint.textselectors import (
     TextPositionSelector,
     TextSelectionError,
     Range,
+    _cached_search_plan,
 )
 from pydantic import ValidationError
 
+# Written out by hand for comparison with the regex a selector builds.
+AMENDMENT_REGEX = re.compile(
+    r"immunities\ of\ citizens\ of\ the\ United\ States;"
+    + r"\s*(.*?)\s*nor\ deny\ to\ any\ person"
+)
+
 
 class TestTextQuoteSelectors:
     preexisting_material = TextQuoteSelector(
@@ -55,19 +62,16 @@ class TestTextQuoteSelectors:
                 "process, system,|method of operation|, concept,|principle"
             )
 
-    def test_failed_prefix(self, make_text):
+    @pytest.mark.parametrize("field", ["prefix", "suffix"])
+    def test_failed_prefix_or_suffix(self, make_text, field):
         """
-        The phrase "sound recordings" is not in
-        the cited subsection, so searching for the interval will fail.
+        The phrase "sound recordings" is not in the cited subsection, so
+        searching for the interval will fail whether the phrase is used as
+        the prefix or as the suffix.
         """
-        after_sound = TextQuoteSelector(prefix="sound recordings")
+        selector = TextQuoteSelector(**{field: "sound recordings"})
         with pytest.raises(TextSelectionError):
-            _ = after_sound.as_position(make_text["s102b"])
-
-    def test_failed_suffix(self, make_text):
-        up_to_sound = TextQuoteSelector(suffix="sound recordings")
-        with pytest.raises(TextSelectionError):
-            _ = up_to_sound.as_position(make_text["s102b"])
+            _ = selector.as_position(make_text["s102b"])
 
     def test_interval_from_just_prefix(self, make_text):
         """
@@ -127,6 +131,11 @@ class TestTextQuoteSelectors:
         )
         assert selector.select_text(make_text["s102b"]) == "does copyright"
 
+    def test_select_text_after_repeated_prefix(self):
+        text = "the quick brown fox. The Quick Brown cat."
+        selector = TextQuoteSelector(prefix="the quick brown", exact="cat")
+        assert selector.as_position(text) == TextPositionSelector(start=37, end=40)
+
     def test_select_text_without_exact(self, make_text):
         selector = TextQuoteSelector(prefix="in no case", suffix="protection")
         assert selector.select_text(make_text["s102b"]) == "does copyright"
@@ -152,21 +161,52 @@ class TestTextQuoteSelectors:
         new_selector = self.amendment_selector.as_position(make_text["amendment"])
         assert new_selector.start == make_text["amendment"].find("nor shall any State")
 
+    def test_make_position_selector_twice(self, make_text):
+        first = self.amendment_selector.as_position(make_text["amendment"])
+        second = self.amendment_selector.as_position(make_text["amendment"])
+        assert first == second
+        assert first is not second
+
+    def test_intern_only_short_selector_text(self):
+        short = TextQuoteSelector(exact="".join(["great ", "text"]))
+        again = TextQuoteSelector(exact="".join(["great ", "text"]))
+        assert short.exact is again.exact
+        long_text = "".join(["great text "] * 100)
+        assert TextQuoteSelector(exact=long_text).exact is long_text
+
+    def test_long_selector_search_plan_not_cached(self):
+        long_text = "".join(["great text "] * 100)
+        selector = TextQuoteSelector(exact=long_text)
+        cached = _cached_search_plan.cache_info().currsize
+        assert selector.find_match("Some " + long_text).start() == 5
+        assert _cached_search_plan.cache_info().currsize == cached
+
     def test_failing_to_make_position_selector(self):
         with pytest.raises(TextSelectionError):
             _ = self.amendment_selector.as_position(
                 "does not contain selected passages"
             )
 
+    def test_no_position_if_suffix_only_appears_before_prefix(self):
+        selector = TextQuoteSelector(prefix="the laws", suffix="All persons")
+        with pytest.raises(TextSelectionError):
+            _ = selector.as_position("All persons born... the laws.")
+
     def test_regex_from_selector_with_just_exact(self):
         selector = TextQuoteSelector(exact="nor shall any State")
         assert selector._passage_regex_without_exact() == r"^.*$"
         assert selector.passage_regex() == r"(nor\ shall\ any\ State)"
 
+    def test_selectors_with_same_text_share_compiled_pattern(self, make_text):
+        first = TextQuoteSelector(exact="Method of Operation")
+        second = TextQuoteSelector(exact="Method of Operation")
+        text = make_text["s102b"]
+        assert first.find_match(text).re is second.find_match(text).re
+
     def test_selector_escapes_special_characters(self):
         selector = TextQuoteSelector(suffix=r"opened the C:\documents folder")
-        pattern = selector.passage_regex()
-        match = re.match(pattern, r"Lee \n opened the C:\documents folder yesterday")
+        pattern = re.compile(selector.passage_regex())
+        match = pattern.match(r"Lee \n opened the C:\documents folder yesterday")
         assert match
 
     def test_regex_match(self, make_text):
@@ -176,11 +216,7 @@ class TestTextQuoteSelectors:
         Provided because double-escaping makes it confusing
         to understand regex patterns constructed by Python.
         """
-        pattern = (
-            r"immunities\ of\ citizens\ of\ the\ United\ States;"
-            + r"\s*(.*?)\s*nor\ deny\ to\ any\ person"
-        )
-        match = re.search(pattern, make_text["amendment"])
+        match = AMENDMENT_REGEX.search(make_text["amendment"])
         assert (
             match.group(1)
             == "nor shall any State deprive any person of life, liberty, or property, without due process of law;"
@@ -189,12 +225,25 @@ class TestTextQuoteSelectors:
     def test_quote_is_unique(self, make_text):
         assert self.amendment_selector.is_unique_in(make_text["amendment"])
 
-    def test_not_unique_if_absent(self):
-        assert not self.amendment_selector.is_unique_in("irrelevant text")
+    @pytest.mark.parametrize(
+        "selector, text",
+        [
+            (amendment_selector, "irrelevant text"),
+            (TextQuoteSelector(exact="a"), "aaaAAAaA"),
+        ],
+        ids=["absent", "appears_twice"],
+    )
+    def test_not_unique(self, selector, text):
+        assert not selector.is_unique_in(text)
+
+    def test_not_unique_if_appears_twice_in_different_case(self, make_text):
+        selector = TextQuoteSelector(exact="In No Case")
+        assert selector.is_unique_in(make_text["s102b"])
+        assert not selector.is_unique_in(make_text["s102b"] + " in no case")
 
-    def test_not_unique_if_appears_twice(self):
-        selector = TextQuoteSelector(exact="a")
-        assert not selector.is_unique_in("aaaAAAaA")
+    def test_unique_with_prefix_across_extra_whitespace(self):
+        selector = TextQuoteSelector(prefix="privileges or", exact="immunities")
+        assert selector.is_unique_in("the privileges or\n   immunities of citizens")
 
     def test_long_passage_truncated_in_exception(self, make_text):
         selector = TextQuoteSelector(exact="things left unsaid")
@@ -317,20 +366,18 @@ class TestCreateTextPositionSelectors:
 
 
 class TestCombineTextPositionSelectors:
-    def test_add_position_selectors(self):
+    @pytest.mark.parametrize(
+        "right_start, right_end",
+        [(12, 27), (20, None)],
+        ids=["with_endpoint", "without_endpoint"],
+    )
+    def test_add_position_selectors(self, right_start, right_end):
         left = TextPositionSelector(start=5, end=22)
-        right = TextPositionSelector(start=12, end=27)
+        right = TextPositionSelector(start=right_start, end=right_end)
         new = left + right
         assert isinstance(new, TextPositionSelector)
         assert new.start == 5
-        assert new.end == 27
-
-    def test_add_selector_without_endpoint(self):
-        left = TextPositionSelector(start=5, end=22)
-        right = TextPositionSelector(start=20)
-        new = left + right
-        assert new.start == 5
-        assert new.end is None
+        assert new.end == right_end
 
     def test_add_infinite_selector(self):
         left = TextPositionSelector(start=5, end=None)
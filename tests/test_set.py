@@ -53,6 +53,28 @@ class TestMakeSelectorSet:
         position_set = factory.from_selection(TextPositionSelector(start=5, end=10))
         assert position_set.ranges()[0].start == 5
 
+    def test_make_selector_set_from_many_selectors(self):
+        selectors = [
+            TextPositionSelector(start=start, end=start + 6)
+            for start in range(1000, -1, -5)
+        ]
+        selectors.append(TextPositionSelector(start=2000))
+        position_set = TextPositionSet.from_selectors(selectors)
+        assert [(item.start, item.end) for item in position_set.positions] == [
+            (0, 1006),
+            (2000, None),
+        ]
+
+    def test_factory_finds_quote_again_after_text_changes(self):
+        factory = TextPositionSetFactory(text="Here is some great text.")
+        first = factory.from_exact_strings(["great"])
+        again = factory.from_exact_strings(["great"])
+        assert first == again
+        assert first.positions[0] is not again.positions[0]
+        factory.text = "This great text is different."
+        moved = factory.from_exact_strings(["great"])
+        assert moved.positions[0].start == 5
+
     def test_make_selector_set_from_list_of_strings(self):
         factory = TextPositionSetFactory(text="Here is some great text.")
         position_set = factory.from_selection(["Here is some", "text."])
@@ -128,6 +150,14 @@ class TestMakeSelectorSet:
         assert new.positions[0].start == 4
         assert new.positions[0].end == 23
 
+    def test_positions_of_repeated_quotes(self):
+        text = "red orange yellow green blue indigo violet"
+        quote = TextQuoteSelector(exact="blue indigo")
+        group = TextPositionSet(quotes=[quote, quote])
+        first, second = group.positions_of_quote_selectors(text)
+        assert first == second
+        assert first is not second
+
     def test_make_position_set_from_dict(self):
         data = {"positions": [{"start": 3, "end": 15}]}
         result = TextPositionSet(**data)
@@ -195,6 +225,32 @@ class TestCombineSelectorSet:
         with pytest.raises(IndexError):
             _ = group + -15
 
+    def test_error_add_negative_int_to_reordered_selector_set(self):
+        group = TextPositionSet()
+        group.positions = [
+            TextPositionSelector(start=20, end=30),
+            TextPositionSelector(start=5, end=10),
+        ]
+        with pytest.raises(IndexError, match=r"\(5, 10\)"):
+            _ = group + -15
+        shifted = group + -5
+        assert [(item.start, item.end) for item in shifted.positions] == [
+            (0, 5),
+            (15, 25),
+        ]
+
+    def test_subtract_int_from_reordered_selector_set(self):
+        group = TextPositionSet()
+        group.positions = [
+            TextPositionSelector(start=20, end=30),
+            TextPositionSelector(start=5, end=10),
+        ]
+        shifted = group - 8
+        assert [(item.start, item.end) for item in shifted.positions] == [
+            (0, 2),
+            (12, 22),
+        ]
+
     def test_subtract_too_much_from_selector_set(self):
         quotes = [
             TextPositionSelector(start=5, end=10),
@@ -291,6 +347,65 @@ class TestCombineSelectorSet:
         assert combined.ranges()[0].end == 100
         assert isinstance(combined, TextPositionSet)
 
+    def test_intersection_of_sets_with_several_ranges(self):
+        left = TextPositionSet(
+            positions=[
+                TextPositionSelector(start=0, end=10),
+                TextPositionSelector(start=20, end=30),
+                TextPositionSelector(start=40),
+            ]
+        )
+        right = TextPositionSet(
+            positions=[
+                TextPositionSelector(start=5, end=25),
+                TextPositionSelector(start=28, end=45),
+            ]
+        )
+        combined = left & right
+        assert [(item.start, item.end) for item in combined.positions] == [
+            (5, 10),
+            (20, 25),
+            (28, 30),
+            (40, 45),
+        ]
+
+    def test_difference_of_sets_with_several_ranges(self):
+        left = TextPositionSet(
+            positions=[
+                TextPositionSelector(start=0, end=10),
+                TextPositionSelector(start=20, end=30),
+                TextPositionSelector(start=40),
+            ]
+        )
+        right = TextPositionSet(
+            positions=[
+                TextPositionSelector(start=5, end=22),
+                TextPositionSelector(start=24, end=26),
+                TextPositionSelector(start=50, end=60),
+            ]
+        )
+        difference = left - right
+        assert [(item.start, item.end) for item in difference.positions] == [
+            (0, 5),
+            (22, 24),
+            (26, 30),
+            (40, 50),
+            (60, None),
+        ]
+
+    @pytest.mark.parametrize(
+        "position, expected",
+        [(0, False), (5, True), (9, True), (10, False), (20, True), (1000, True)],
+    )
+    def test_position_in_set(self, position, expected):
+        selector_set = TextPositionSet(
+            positions=[
+                TextPositionSelector(start=5, end=10),
+                TextPositionSelector(start=20),
+            ]
+        )
+        assert (position in selector_set) is expected
+
     def test_make_quote_selectors_from_set(self, make_text):
         quote = TextQuoteSelector(exact="United States", suffix=" and subject")
         position = quote.as_position(make_text["amendment"])
@@ -374,6 +489,24 @@ class TestCompareSelectorSet:
         assert selector_set == other_set
         assert selector_set >= other_set
 
+    def test_ranges_after_appending_position(self):
+        selector_set = TextPositionSet(
+            positions=[TextPositionSelector(start=5, end=10)]
+        )
+        assert selector_set.ranges() == [Range(5, 10)]
+        selector_set.positions.append(TextPositionSelector(start=10, end=15))
+        assert selector_set.ranges() == [Range(5, 15)]
+        assert selector_set.as_string("a" * 5 + "b" * 10) == "…bbbbbbbbbb"
+
+    def test_not_equal_after_changing_position_in_place(self):
+        selector_set = TextPositionSet(positions=[TextPositionSelector(start=0, end=4)])
+        other_set = TextPositionSet(positions=[TextPositionSelector(start=0, end=4)])
+        assert selector_set == other_set
+        other_set.positions[0].end = 7
+        assert selector_set != other_set
+        other_set.positions.append(TextPositionSelector(start=10, end=12))
+        assert selector_set != other_set
+
     def test_set_greater_than_selector(self):
         selector_set = TextPositionSet(
             positions=[
@@ -385,6 +518,34 @@ class TestCompareSelectorSet:
         assert selector_set > other_selector
         assert selector_set >= other_selector
 
+    @pytest.mark.parametrize(
+        "start, end, expected",
+        [
+            (0, 4, True),
+            (2, 4, True),
+            (4, 5, False),
+            (3, 6, False),
+            (5, None, False),
+            (20, None, True),
+        ],
+        ids=["first", "inside", "gap", "across_gap", "open_end", "after_end"],
+    )
+    def test_set_greater_than_set_with_gaps(self, start, end, expected):
+        selector_set = TextPositionSet(
+            positions=[
+                TextPositionSelector(start=0, end=4),
+                TextPositionSelector(start=5, end=10),
+                TextPositionSelector(start=20),
+            ]
+        )
+        other = TextPositionSet(
+            positions=[
+                TextPositionSelector(start=6, end=8),
+                TextPositionSelector(start=start, end=end),
+            ]
+        )
+        assert (selector_set > other) is expected
+
 
 class TestTextFromSelectorSet:
     def test_get_text_selection_from_set(self, make_text):
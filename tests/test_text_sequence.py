@@ -2,12 +2,16 @@ import pytest
 
 from anchorpoint.textselectors import (
     TextPositionSet,
-    TextQuoteSelector,
     TextPositionSelector,
 )
 from anchorpoint.textselectors import TextPositionSetFactory
 from anchorpoint.textsequences import TextPassage, TextSequence
 
+# Passages quoted from s102b, shared by tests that don't change them.
+IN_NO_CASE = TextPassage("In no case does copyright protection")
+EXTEND_TO_ANY_IDEA = TextPassage("extend to any idea")
+EMBODIED_IN_SUCH_WORK = TextPassage("embodied in such work.")
+
 
 class TestCompareTextPassage:
     def test_greater_than_None(self):
@@ -19,15 +23,12 @@ class TestCompareTextPassage:
         words = TextPassage("words")
         assert not words.means(None)
 
-    def test_cannot_compare_to_TextSequence(self):
-        words = TextPassage("words")
-        with pytest.raises(TypeError):
-            words >= TextSequence(["words", "more words"])
-
-    def test_cannot_check_name_meaning_with_TextSequence(self):
-        words = TextPassage("words")
-        with pytest.raises(TypeError):
-            words.means(TextSequence(["words", "more words"]))
+    def test_meaning_changes_after_replacing_text(self):
+        words = TextPassage("words.")
+        assert words.means(TextPassage("words"))
+        words.text = "other words."
+        assert not words.means(TextPassage("words"))
+        assert words >= TextPassage("words;")
 
 
 class TestCreateTextSequence:
@@ -85,43 +86,32 @@ class TestCreateTextSequence:
 
 
 class TestCompareTextSequence:
-    def test_same_meaning_regardless_of_leading_ellipsis(self, make_text):
-        passage = make_text["s102b"]
-        factory = TextPositionSetFactory(text=passage)
-        selector_set = factory.from_quote_selectors(
-            [
-                TextQuoteSelector(exact="In no case does copyright protection"),
-                TextQuoteSelector(exact="extend to any idea"),
-            ]
-        )
-        passages_as_sequence = selector_set.as_text_sequence(passage)
-        handcrafted_sequence = TextSequence(
-            passages=[
-                None,
-                TextPassage("In no case does copyright protection"),
-                None,
-                TextPassage("extend to any idea"),
-            ]
-        )
-        assert passages_as_sequence.means(handcrafted_sequence)
-        assert not passages_as_sequence > handcrafted_sequence
+    @pytest.mark.parametrize(
+        "passages, means, greater",
+        [
+            ([None, IN_NO_CASE, None, EXTEND_TO_ANY_IDEA], True, False),
+            ([IN_NO_CASE, None, EXTEND_TO_ANY_IDEA], True, False),
+            ([IN_NO_CASE, EXTEND_TO_ANY_IDEA], False, True),
+        ],
+        ids=["leading_ellipsis", "same_passages", "omitting_None"],
+    )
+    def test_compare_to_handcrafted_sequence(
+        self, s102b_passages_as_sequence, passages, means, greater
+    ):
+        handcrafted_sequence = TextSequence(passages=passages)
+        assert s102b_passages_as_sequence.means(handcrafted_sequence) is means
+        assert (s102b_passages_as_sequence > handcrafted_sequence) is greater
 
     def test_same_meaning_comparing_text_to_none(self):
         first_sequence = TextSequence(
-            passages=[
-                None,
-                TextPassage("In no case does copyright protection"),
-                None,
-                TextPassage("extend to any idea"),
-                None,
-            ]
+            passages=[None, IN_NO_CASE, None, EXTEND_TO_ANY_IDEA, None]
         )
         second_sequence = TextSequence(
             passages=[
                 None,
-                TextPassage("In no case does copyright protection"),
+                IN_NO_CASE,
                 TextPassage("of a college memoir"),
-                TextPassage("extend to any idea"),
+                EXTEND_TO_ANY_IDEA,
                 None,
             ]
         )
@@ -129,94 +119,54 @@ class TestCompareTextSequence:
         assert not first_sequence.means(second_sequence)
         assert second_sequence > first_sequence
 
-    def test_one_sequence_means_another(self, make_text):
-        passage = make_text["s102b"]
-        factory = TextPositionSetFactory(text=passage)
-        selector_set = factory.from_quote_selectors(
-            [
-                TextQuoteSelector(exact="In no case does copyright protection"),
-                TextQuoteSelector(exact="extend to any idea"),
-            ]
-        )
-        passages_as_sequence = selector_set.as_text_sequence(passage)
-        handcrafted_sequence = TextSequence(
-            passages=[
-                TextPassage("In no case does copyright protection"),
-                None,
-                TextPassage("extend to any idea"),
-            ]
-        )
-        assert passages_as_sequence.means(handcrafted_sequence)
-        assert not passages_as_sequence > handcrafted_sequence
-
-    def test_omitting_None_from_sequence_changes_meaning(self, make_text):
-        passage = make_text["s102b"]
-        factory = TextPositionSetFactory(text=passage)
-        selector_set = factory.from_quote_selectors(
-            [
-                TextQuoteSelector(exact="In no case does copyright protection"),
-                TextQuoteSelector(exact="extend to any idea"),
-            ]
-        )
-        passages_as_sequence = selector_set.as_text_sequence(passage)
-        handcrafted_sequence = TextSequence(
-            passages=[
-                TextPassage("In no case does copyright protection"),
-                TextPassage("extend to any idea"),
-            ]
-        )
+    def test_omitting_None_from_sequence_changes_string(
+        self, s102b_passages_as_sequence
+    ):
+        handcrafted_sequence = TextSequence(passages=[IN_NO_CASE, EXTEND_TO_ANY_IDEA])
         assert (
-            str(passages_as_sequence)
+            str(s102b_passages_as_sequence)
             == "In no case does copyright protection…extend to any idea…"
         )
         assert (
             str(handcrafted_sequence)
             == "In no case does copyright protection extend to any idea"
         )
-        assert not passages_as_sequence.means(handcrafted_sequence)
 
-    def test_full_passage_implies_selections(self, make_text):
+    def test_full_passage_implies_selections(
+        self, make_text, s102b_passages_as_sequence
+    ):
         passage = make_text["s102b"]
-        factory = TextPositionSetFactory(text=passage)
-        selector_set = factory.from_quote_selectors(
-            [
-                TextQuoteSelector(exact="In no case does copyright protection"),
-                TextQuoteSelector(exact="extend to any idea"),
-            ]
-        )
         full_passage = TextPositionSet(
             positions=[TextPositionSelector(start=0, end=200)]
         )
 
-        passages_as_sequence = selector_set.as_text_sequence(passage)
+        passages_as_sequence = s102b_passages_as_sequence
         full_passage_as_sequence = full_passage.as_text_sequence(passage)
         assert full_passage_as_sequence > passages_as_sequence
         assert not passages_as_sequence > full_passage_as_sequence
 
-    def test_cannot_compare_to_TextPassage(self):
+    @pytest.mark.parametrize(
+        "compare",
+        [
+            lambda passage, sequence: passage >= sequence,
+            lambda passage, sequence: passage.means(sequence),
+            lambda passage, sequence: sequence >= passage,
+            lambda passage, sequence: sequence.means(passage),
+        ],
+        ids=["passage_ge", "passage_means", "sequence_ge", "sequence_means"],
+    )
+    def test_cannot_compare_TextPassage_and_TextSequence(self, compare):
         words = TextPassage("words")
         with pytest.raises(TypeError):
-            TextSequence(["words", "more words"]) >= words
-
-    def test_cannot_check_name_meaning_with_TextSequence(self):
-        words = TextPassage("words")
-        with pytest.raises(TypeError):
-            TextSequence(["words", "more words"]).means(words)
+            compare(words, TextSequence(["words", "more words"]))
 
 
 class TestAddTextSequence:
     def test_handle_Nones_at_beginning_and_end(self):
         handcrafted_sequence = TextSequence(
-            passages=[
-                TextPassage("In no case does copyright protection"),
-                None,
-                TextPassage("extend to any idea"),
-                None,
-            ]
-        )
-        second_sequence = TextSequence(
-            passages=[None, TextPassage("embodied in such work.")]
+            passages=[IN_NO_CASE, None, EXTEND_TO_ANY_IDEA, None]
         )
+        second_sequence = TextSequence(passages=[None, EMBODIED_IN_SUCH_WORK])
         new_sequence = handcrafted_sequence + second_sequence
         assert new_sequence[1] is None
         assert new_sequence[2] is not None
@@ -248,6 +198,14 @@ class TestAddTextSequence:
         right = TextSequence(passages=[TextPassage("Some Text.")])
         assert left + right == right
 
+    def test_add_in_place_does_not_change_original(self):
+        original = TextSequence(passages=[TextPassage("In no case"), None])
+        sequence = original
+        sequence += TextSequence(passages=[None, EXTEND_TO_ANY_IDEA])
+        assert len(sequence) == 3
+        assert str(sequence) == "In no case…extend to any idea"
+        assert len(original) == 2
+
     def test_add_sequence_and_None(self):
         left = TextSequence(passages=[TextPassage("Some Text.")])
         with pytest.raises(TypeError):